@@ -1,8 +1,11 @@
 # app.py
+import gc
+import hashlib
 import streamlit as st
-import base64
 import streamlit.components.v1 as components
-from logo_generator import create_logo_svg
+from urllib.parse import quote
+from logo_generator import create_logo_svg, create_logo_png_bytes, PNG_SUPPORTED
+import preview_server
 
 # 1. Defaults
 DEFAULTS = {
@@ -25,7 +28,38 @@ DEFAULTS = {
     "bg":                      "#27374D",
 }
 
+# Widget keys and number_input formats, precomputed so every rerun
+# skips the label munging and isinstance checks in the slider helper
+SLIDER_KEYS = {
+    "Diameter (px)":         ("diameter_px",           "%d"),
+    "Wavelength (%)":        ("wavelength_pct",        "%f"),
+    "Amplitude (%)":         ("amplitude_pct",         "%f"),
+    "Line width (px)":       ("line_width_px",         "%d"),
+    "Global projection (%)": ("global_projection_pct", "%f"),
+    "Wave Adj 1 (%)":        ("wave_adj_1_pct",        "%f"),
+    "Wave Adj 2 (%)":        ("wave_adj_2_pct",        "%f"),
+}
+
 st.set_page_config(page_title="Logo Designer", layout="wide")
+
+# Cyclic GC pauses land in the middle of renders; the hot path allocates
+# no reference cycles, so let refcounting do the work. Freeze what's
+# already live first so it never gets rescanned if GC is re-enabled.
+gc.freeze()
+gc.disable()
+
+
+# Sidecar server for the main preview: fingerprinted URLs + immutable
+# Cache-Control mean the browser re-fetches nothing when params repeat.
+@st.cache_resource
+def _preview_port():
+    try:
+        return preview_server.start()
+    except OSError:
+        return None
+
+
+PREVIEW_PORT = _preview_port()
 st.title("Ocean BioMetrics Logo Designer")
 
 # Two columns: parameters | preview
@@ -41,7 +75,7 @@ with param_col:
 
     # Slider + manual input helper
     def slider_with_input(label, mn, mx, default, step):
-        key = label.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("%", "pct")
+        key, fmt = SLIDER_KEYS[label]
         skey, ikey = f"s_{key}", f"i_{key}"
         if skey not in st.session_state: st.session_state[skey] = default
         if ikey not in st.session_state: st.session_state[ikey] = default
@@ -58,7 +92,7 @@ with param_col:
         c2.number_input("", mn, mx,
                         value=st.session_state[ikey],
                         step=step,
-                        format="%f" if isinstance(default, float) else "%d",
+                        format=fmt,
                         key=ikey,
                         on_change=i2s)
         return st.session_state[skey]
@@ -88,20 +122,68 @@ with param_col:
         "wave_adj2": wave_adj2
     }
 
+    # Debounce: with auto-update off, dragging a slider reruns the script
+    # but the preview keeps the last applied params, so a 20-step drag
+    # costs one render instead of 20.
+    auto_update = st.checkbox(
+        "Auto-update preview", value=True,
+        help="Turn off to batch slider changes and apply them at once."
+    )
+    if auto_update:
+        st.session_state["applied_params"] = params
+    else:
+        if st.button("Apply changes") or "applied_params" not in st.session_state:
+            st.session_state["applied_params"] = params
+        params = st.session_state["applied_params"]
+        diameter = params["diameter"]
+
 with preview_col:
     st.header("Large Preview")
 
-    # Generate SVG string once
-    svg_str = create_logo_svg(**params)
-
-    # Encode to Base64
-    svg_b64 = base64.b64encode(svg_str.encode("utf-8")).decode("utf-8")
-
-    # Main full-width preview
-    main_img = f"<img src='data:image/svg+xml;base64,{svg_b64}' style='width:100%;height:auto;'/>"
-    components.html(main_img, height=int(diameter * 1.2))
-
-    # Mini Preview directly below
+    # Single-slot cache: reruns that didn't move any preview-affecting
+    # widget (button clicks, popovers, ...) skip generation and escaping
+    # entirely -- cheaper than even an st.cache_data lookup.
+    key = tuple(sorted(params.items()))
+    if st.session_state.get("_last_key") == key:
+        svg_str = st.session_state["_last_svg"]
+        data_uri = st.session_state["_last_uri"]
+    else:
+        # Generate SVG string once; URL-escaped data URI needs no base64
+        svg_str = create_logo_svg(**params)
+        data_uri = "data:image/svg+xml;utf8," + quote(svg_str)
+        st.session_state["_last_key"] = key
+        st.session_state["_last_svg"] = svg_str
+        st.session_state["_last_uri"] = data_uri
+
+    # Main full-width preview: served by fingerprint so an unchanged
+    # parameter set is a browser cache hit, not a re-shipped blob.
+    # Falls back to the inline data URI if the sidecar couldn't bind
+    # (or the browser isn't on this machine to reach localhost).
+    if PREVIEW_PORT is not None:
+        fingerprint = hashlib.sha1(svg_str.encode("utf-8")).hexdigest()
+        preview_server.publish(fingerprint, "image/svg+xml",
+                               svg_str.encode("utf-8"))
+        components.html(
+            f"<img src='http://localhost:{PREVIEW_PORT}/logo.svg?h={fingerprint}'"
+            f" style='width:100%;height:auto;'"
+            f" onerror=\"this.src='{data_uri}'\"/>",
+            height=int(diameter * 1.2),
+        )
+    else:
+        st.markdown(
+            f"<img src='{data_uri}' style='width:100%;height:auto;'/>",
+            unsafe_allow_html=True,
+        )
+
+    # Mini Preview directly below: reuses the same render, browser scales it
     st.subheader("Mini Preview")
-    thumb_img = f"<img src='data:image/svg+xml;base64,{svg_b64}' width='30'/>"
-    components.html(thumb_img, height=50)
+    st.markdown(f"<img src='{data_uri}' width='30'/>", unsafe_allow_html=True)
+
+    # Downloads share the one render per parameter set (cached in
+    # logo_generator), so the PNG is rasterized at most once per change.
+    d1, d2 = st.columns(2)
+    d1.download_button("Download SVG", svg_str, file_name="logo.svg",
+                       mime="image/svg+xml")
+    if PNG_SUPPORTED:
+        d2.download_button("Download PNG", create_logo_png_bytes(**params),
+                           file_name="logo.png", mime="image/png")
@@ -0,0 +1,62 @@
+# preview_server.py
+#!/usr/bin/env python3
+"""
+Tiny sidecar HTTP server for preview blobs.
+
+Streamlit's delta protocol re-ships an inline preview to the browser on
+every rerun. Serving the blob from a fingerprinted URL instead lets the
+browser's HTTP cache skip the transfer entirely whenever the parameters
+(and therefore the hash) are unchanged.
+"""
+
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+MAX_ENTRIES = 128
+
+_blobs = OrderedDict()  # fingerprint -> (mime, bytes)
+_lock = threading.Lock()
+
+
+def publish(key: str, mime: str, data: bytes) -> None:
+    """Register a blob under its fingerprint, evicting least-recently
+    used entries beyond MAX_ENTRIES."""
+    with _lock:
+        _blobs[key] = (mime, data)
+        _blobs.move_to_end(key)
+        while len(_blobs) > MAX_ENTRIES:
+            _blobs.popitem(last=False)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        key = parse_qs(urlparse(self.path).query).get("h", [""])[0]
+        with _lock:
+            blob = _blobs.get(key)
+            if blob is not None:
+                _blobs.move_to_end(key)
+        if blob is None:
+            self.send_error(404)
+            return
+        mime, data = blob
+        self.send_response(200)
+        self.send_header("Content-Type", mime)
+        self.send_header("Content-Length", str(len(data)))
+        # The URL is content-addressed, so the response never changes
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # keep request noise out of the Streamlit console
+        pass
+
+
+def start(port: int = 0) -> int:
+    """Start serving on a daemon thread; returns the bound port
+    (an OS-assigned free port when called with the default 0)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]